@@ -6,7 +6,7 @@ a = Analysis(
     pathex=[],
     binaries=[],
     datas=[('.env', '.')],
-    hiddenimports=[],
+    hiddenimports=['python_calamine'],
     hookspath=[],
     hooksconfig={},
     runtime_hooks=[],
@@ -13,12 +13,18 @@
 # 활용을 잘 하면 유튜브 컨텐츠 분석/기획 등에 유용하게 사용할 수 있습니다.
 
 import os
+import queue
+import re
+import threading
+from concurrent.futures import ThreadPoolExecutor
 
 from dotenv import load_dotenv
+import orjson
 import requests
-import pandas as pd
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from pyexcelerate import Workbook, Style, Format
 from datetime import datetime
-import isodate
 import tkinter as tk
 from tkinter import ttk, messagebox, scrolledtext
 
@@ -26,19 +32,97 @@ from tkinter import ttk, messagebox, scrolledtext
 # (예: YOUTUBE_API_KEY 등)
 load_dotenv()
 
+# 유튜브 재생시간(ISO 8601, 예: 'PT1H2M3S', 긴 영상은 'P1DT2H'나 'P1W2D' 형태도 가능)을
+# 주/일/시/분/초 단위로 바로 잘라내기 위한 정규식 (모듈 로드 시 한 번만 컴파일)
+# 문자열 전체가 형식에 맞아야 하므로 ^...$ 로 고정
+_DURATION_RE = re.compile(r'^P(?:(\d+)W)?(?:(\d+)D)?(?:T(?:(\d+)H)?(?:(\d+)M)?(?:(\d+)S)?)?$')
+
+# 유튜브 데이터 API(v3) 엔드포인트 (쿼리 파라미터는 params 인자로 전달)
+SEARCH_API_URL = 'https://www.googleapis.com/youtube/v3/search'
+VIDEOS_API_URL = 'https://www.googleapis.com/youtube/v3/videos'
+# 동영상 시청 페이지 URL의 고정 앞부분 (뒤에 동영상 ID만 붙여서 사용)
+WATCH_URL_PREFIX = 'https://www.youtube.com/watch?v='
+# 한 번의 검색에서 수집할 최대 동영상 개수 (임의로 정한 값)
+MAX_RESULTS = 200
+
+# 수집 결과의 컬럼(엑셀 헤더) 순서
+# fetch_youtube_data는 각 동영상을 이 순서대로 값이 들어 있는 튜플로 반환합니다.
+VIDEO_COLUMNS = (
+    'Index',
+    'Title',
+    'Channel Title',
+    # 채널 ID도 함께 엑셀에 저장되도록 컬럼 추가
+    'Channel ID',
+    'Duration',
+    'Views',
+    'Comments',
+    'URL',
+    'Thumbnail URL',
+    'Tags',
+    'Published Date',
+)
+
 def format_duration(duration):
     """
     유튜브 API에서 내려주는 ISO 8601 형식의 재생시간(duration)을
     사람이 보기 쉬운 "HH:MM:SS" 형태의 문자열로 변환하는 함수입니다.
 
     예) 'PT1H2M3S' -> '01:02:03'
+    형식을 알 수 없는 값은 0초로 바꾸지 않고 받은 값을 그대로 반환합니다. (값이 없으면 '')
+    """
+    match = _DURATION_RE.match(duration or '')
+    # 형식이 맞지 않거나 단위가 하나도 없는 경우('P', 'PT' 등)는 원래 값을 그대로 표시
+    if not match or not any(match.groups()):
+        return duration or ''
+    # 정규식으로 캡처한 주/일/시/분/초 값을 정수로 변환 (없는 단위는 0)
+    weeks, days, hours, minutes, seconds = (int(value or 0) for value in match.groups())
+    # 주(week)와 일(day) 단위는 시간으로 환산하여 합산
+    hours += (weeks * 7 + days) * 24
+    return f"{hours:02}:{minutes:02}:{seconds:02}"
+
+def create_session():
+    """
+    유튜브 데이터 API 호출에 재사용할 requests.Session을 생성하는 함수입니다.
+
+    - 같은 호스트(googleapis.com)로 반복 요청하므로 keep-alive 연결을 재사용하여
+      매 요청마다 TCP/TLS 핸드셰이크를 다시 하지 않도록 합니다.
+    - 429(요청 과다), 5xx(서버 오류) 응답은 지수 백오프로 최대 3회 재시도합니다.
+    """
+    session = requests.Session()
+    # 응답 본문(JSON)을 gzip/deflate로 압축해서 받도록 명시적으로 요청
+    # (전송량이 크게 줄어들며, 압축 해제는 urllib3가 응답을 파싱하기 전에 자동으로 처리)
+    session.headers['Accept-Encoding'] = 'gzip, deflate'
+
+    retry = Retry(
+        total=3,
+        backoff_factor=0.3,
+        status_forcelist=[429, 500, 502, 503, 504],
+    )
+    adapter = HTTPAdapter(pool_connections=1, pool_maxsize=16, max_retries=retry)
+    session.mount("https://", adapter)
+    return session
+
+def fetch_video_details(session, api_key, video_ids):
+    """
+    videos.list API 한 번으로 여러 동영상(최대 50개)의 상세 정보를 조회하는 함수입니다.
+
+    작업 스레드에서 호출되므로 로그는 남기지 않고,
+    네트워크 오류는 requests 예외 그대로 호출한 쪽에 전달합니다.
+
+    반환값
+    - API 응답의 `items` 리스트 (삭제/비공개 동영상은 빠질 수 있음)
     """
-    # ISO 8601 형식의 문자열을 timedelta 형태로 파싱
-    parsed_duration = isodate.parse_duration(duration)
-    # 총 초(second)를 기준으로 3600초(1시간) 단위로 나누어 시/분/초 계산
-    hours, remainder = divmod(parsed_duration.total_seconds(), 3600)
-    minutes, seconds = divmod(remainder, 60)
-    return f"{int(hours):02}:{int(minutes):02}:{int(seconds):02}"
+    # 동영상 상세 정보(재생시간, 통계, 제목 등)를 가져오는 API 파라미터
+    # (id로 조회할 때는 maxResults를 지원하지 않으며, 넘긴 ID 개수가 곧 조회 개수)
+    params = {
+        'id': ','.join(video_ids),
+        'key': api_key,
+        'part': 'contentDetails,statistics,snippet',
+    }
+    video_details_response = session.get(VIDEOS_API_URL, params=params, timeout=10)
+    video_details_response.raise_for_status()
+    # 표준 json 모듈 대신 orjson으로 응답 본문(bytes)을 바로 파싱 (50개 묶음 응답이 커서 효과가 큼)
+    return orjson.loads(video_details_response.content).get('items', [])
 
 def fetch_youtube_data(api_key, search_query, channel_id, start_date=None, end_date=None, log_callback=None):
     """
@@ -52,7 +136,8 @@ def fetch_youtube_data(api_key, search_query, channel_id, start_date=None, end_d
     - end_date: 조회 종료 날짜(YYYY-MM-DD, None 또는 빈 문자열이면 제한 없음)
 
     반환값
-    - 각 동영상의 주요 정보(제목, 채널명, 재생시간, 조회수 등)를 담은 딕셔너리의 리스트
+    - 각 동영상의 주요 정보(제목, 채널명, 재생시간, 조회수 등)를
+      VIDEO_COLUMNS 순서대로 담은 튜플의 리스트
     """
     # GUI 모드에서도 진행 상황을 볼 수 있도록 로그 콜백을 활용합니다.
     # log_callback이 지정되지 않은 경우 기본적으로 print를 사용합니다.
@@ -61,35 +146,42 @@ def fetch_youtube_data(api_key, search_query, channel_id, start_date=None, end_d
 
     log_callback("검색 조건으로 유튜브 검색을 시작합니다...")
 
-    # 검색 요청의 기본 URL (검색어/채널/날짜 범위에 따라 파라미터를 추가하는 방식)
-    base_search_url = f'https://www.googleapis.com/youtube/v3/search?key={api_key}&part=snippet&maxResults=50&type=video&order=date'
+    # 검색 요청의 기본 파라미터 (검색어/채널/날짜 범위에 따라 파라미터를 추가하는 방식)
+    # URL 인코딩(한글 검색어 등)은 requests가 params를 처리하면서 자동으로 적용합니다.
+    search_params = {
+        'key': api_key,
+        'part': 'snippet',
+        'maxResults': 50,
+        'type': 'video',
+        'order': 'date',
+    }
 
     # 검색어가 있으면 q 파라미터로 추가
     if search_query:
-        base_search_url += f'&q={search_query}'
+        search_params['q'] = search_query
 
     # 채널 ID가 있으면 channelId 파라미터로 추가
     if channel_id:
-        base_search_url += f'&channelId={channel_id}'
+        search_params['channelId'] = channel_id
 
     # 시작/종료 날짜가 있으면 해당 기간으로 검색 기간을 제한
     # (YYYY-MM-DD 형식의 문자열을 받아, RFC3339 형식으로 변환하여 사용)
-    if start_date:
+    # 날짜 변환은 반복문 밖에서 한 번만 수행하고, 결과는 search_params에 넣어 모든 페이지 요청에 재사용합니다.
+    date_filters = [
+        ('publishedAfter', start_date, "00:00:00", "시작"),
+        ('publishedBefore', end_date, "23:59:59", "종료"),
+    ]
+    for param_name, date_str, time_str, label in date_filters:
+        if not date_str:
+            continue
         try:
-            start_dt = datetime.strptime(start_date, "%Y-%m-%d")
-            start_iso = start_dt.strftime("%Y-%m-%dT00:00:00Z")
-            base_search_url += f"&publishedAfter={start_iso}"
+            # 형식 검증 겸 'YYYY-M-D'처럼 입력된 값을 'YYYY-MM-DD'로 정규화
+            date_value = datetime.strptime(date_str, "%Y-%m-%d").date()
         except ValueError:
             # 형식이 잘못된 경우에는 로그만 남기고 필터는 적용하지 않음
-            log_callback(f"[경고] 시작 날짜 형식이 올바르지 않습니다(YYYY-MM-DD): {start_date}")
-
-    if end_date:
-        try:
-            end_dt = datetime.strptime(end_date, "%Y-%m-%d")
-            end_iso = end_dt.strftime("%Y-%m-%dT23:59:59Z")
-            base_search_url += f"&publishedBefore={end_iso}"
-        except ValueError:
-            log_callback(f"[경고] 종료 날짜 형식이 올바르지 않습니다(YYYY-MM-DD): {end_date}")
+            log_callback(f"[경고] {label} 날짜 형식이 올바르지 않습니다(YYYY-MM-DD): {date_str}")
+            continue
+        search_params[param_name] = f"{date_value.isoformat()}T{time_str}Z"
 
     # 각 동영상의 상세 정보를 담을 리스트
     video_details = []
@@ -98,50 +190,77 @@ def fetch_youtube_data(api_key, search_query, channel_id, start_date=None, end_d
     # 다음 페이지를 요청하기 위한 토큰 (첫 요청 시에는 None)
     next_page_token = None
 
-    while True:
-        # 매 반복마다 기본 검색 URL을 기준으로 새로 URL을 구성
-        search_url = base_search_url
-
-        # 다음 페이지 토큰이 있으면 pageToken 파라미터로 추가
-        if next_page_token:
-            search_url += f'&pageToken={next_page_token}'
+    # 페이지별 상세 정보 조회 작업 목록: (이전 페이지까지의 누적 개수, ID->순번 매핑, Future)
+    detail_jobs = []
+
+    # 모든 API 호출에 하나의 세션을 재사용하여 연결(keep-alive)을 유지
+    session = create_session()
+    # 상세 정보 조회는 작업 스레드에서 실행하여,
+    # 다음 페이지 검색 API 호출과 이전 페이지 상세 정보 조회가 동시에 진행되도록 합니다.
+    # (검색 API는 pageToken이 필요하므로 페이지 순서대로만 호출 가능)
+    executor = ThreadPoolExecutor(max_workers=8)
+
+    try:
+        # 임의로 정한 최대 개수에 도달하면 다음 검색 페이지는 요청하지 않고 종료
+        while total_results_fetched < MAX_RESULTS:
+            # 다음 페이지 토큰이 있으면 pageToken 파라미터만 덧붙여서 요청
+            if next_page_token:
+                params = {**search_params, 'pageToken': next_page_token}
+            else:
+                params = search_params
 
-        try:
-            # 검색 API 호출
-            log_callback("검색 API를 호출하는 중입니다...")
-            search_response = requests.get(search_url, timeout=10)
-            search_response.raise_for_status()
-        except requests.exceptions.RequestException as e:
-            # 네트워크 오류, 타임아웃 등 각종 예외를 로그로 남기고 반복을 종료합니다.
-            log_callback(f"[에러] 검색 결과를 가져오지 못했습니다: {e}")
-            break
-
-        search_results = search_response.json()
-        # 다음 페이지 호출을 위한 토큰 (마지막 페이지이면 존재하지 않을 수 있음)
-        next_page_token = search_results.get('nextPageToken')
-        
-        # 검색 결과(`items`)를 순회하면서 각 동영상의 상세 정보를 다시 조회
-        for index, item in enumerate(search_results.get('items', []), start=1):
-            # 검색 결과 항목에서 동영상 ID 추출
-            video_id = item['id']['videoId']
-            video_url = f"https://www.youtube.com/watch?v={video_id}"
-            log_callback(f"{index}번째 동영상 상세 정보 조회 중: {video_url}")
-
-            # 동영상 상세 정보(재생시간, 통계, 제목 등)를 가져오는 API URL
-            video_details_url = f'https://www.googleapis.com/youtube/v3/videos?id={video_id}&key={api_key}&part=contentDetails,statistics,snippet'
             try:
-                # 동영상 상세 정보 API 호출
-                video_details_response = requests.get(video_details_url, timeout=10)
-                video_details_response.raise_for_status()
+                # 검색 API 호출
+                log_callback("검색 API를 호출하는 중입니다...")
+                search_response = session.get(SEARCH_API_URL, params=params, timeout=10)
+                search_response.raise_for_status()
+            except requests.exceptions.RequestException as e:
+                # 네트워크 오류, 타임아웃 등 각종 예외를 로그로 남기고 반복을 종료합니다.
+                log_callback(f"[에러] 검색 결과를 가져오지 못했습니다: {e}")
+                break
+
+            search_results = orjson.loads(search_response.content)
+            # 다음 페이지 호출을 위한 토큰 (마지막 페이지이면 존재하지 않을 수 있음)
+            next_page_token = search_results.get('nextPageToken')
+
+            # 이번 페이지 검색 결과(`items`)의 동영상 ID를 모두 모아서
+            # videos.list API 한 번으로 상세 정보를 조회합니다. (최대 50개까지 한 번에 조회 가능)
+            # 최대 개수(MAX_RESULTS)를 넘는 항목은 상세 정보를 조회하지 않도록 필요한 만큼만 잘라냄
+            # (`items` 키가 없거나 null로 내려오는 경우도 빈 리스트로 처리하고, 조회는 한 번만 수행)
+            items = search_results.get('items') or []
+            needed = MAX_RESULTS - total_results_fetched
+            video_ids = [item['id']['videoId'] for item in items[:needed]]
+            # 동영상 ID -> 페이지 내 순번(1부터 시작) 매핑 (응답에서 Index를 다시 찾기 위해 사용)
+            index_by_id = {video_id: index for index, video_id in enumerate(video_ids, start=1)}
+
+            if video_ids:
+                log_callback(f"동영상 {len(video_ids)}개의 상세 정보 조회를 요청했습니다.")
+                future = executor.submit(fetch_video_details, session, api_key, video_ids)
+                detail_jobs.append((total_results_fetched, index_by_id, future))
+
+            # 이번 페이지에서 가져온 동영상 개수를 누적
+            total_results_fetched += len(video_ids)
+
+            # 더 이상 다음 페이지가 없으면 반복 종료
+            if not next_page_token:
+                break
+
+        # 페이지 순서대로 상세 정보 조회 결과를 모아서 정리
+        for page_offset, index_by_id, future in detail_jobs:
+            try:
+                items = future.result()
             except requests.exceptions.RequestException as e:
-                # 개별 동영상 정보 조회 실패 시 해당 동영상만 건너뛰고 계속 진행합니다.
-                log_callback(f"[경고] {index}번째 동영상 상세 정보를 가져오지 못했습니다: {e}")
+                # 상세 정보 조회 실패 시 해당 페이지만 건너뛰고 계속 진행합니다.
+                log_callback(f"[경고] 동영상 상세 정보를 가져오지 못했습니다: {e}")
                 continue
 
-            video_info = video_details_response.json()
-            # items가 비어 있지 않을 때에만 처리
-            if 'items' in video_info and video_info['items']:
-                video_data = video_info['items'][0]
+            # 응답에 포함된 동영상(삭제/비공개 동영상은 빠질 수 있음)만 처리
+            for video_data in items:
+                video_id = video_data['id']
+                index = index_by_id[video_id]
+                # URL 열은 엑셀 요약 도구(excel_summarizer.py)의 입력으로도 쓰이므로
+                # 수식(HYPERLINK)이 아닌 실제 URL 문자열로 저장
+                video_url = WATCH_URL_PREFIX + video_id
                 # 동영상 제목
                 title = video_data['snippet']['title']
                 # 채널명
@@ -159,35 +278,52 @@ def fetch_youtube_data(api_key, search_query, channel_id, start_date=None, end_d
                 # 썸네일 URL (high 해상도 기준)
                 thumbnail_url = video_data['snippet']['thumbnails']['high']['url']
                 # 업로드 날짜 (문자열 -> date 객체로 변환)
-                published_date = datetime.strptime(video_data['snippet']['publishedAt'], '%Y-%m-%dT%H:%M:%SZ').date()
+                # RFC3339 형식('...Z')이므로 끝의 'Z'만 떼고 strptime보다 빠른 fromisoformat으로 파싱
+                published_date = datetime.fromisoformat(video_data['snippet']['publishedAt'].rstrip('Z')).date()
 
-                # 하나의 동영상에 대한 정보를 딕셔너리로 정리해서 리스트에 추가
-                video_details.append({
+                # 하나의 동영상에 대한 정보를 VIDEO_COLUMNS 순서의 튜플로 정리해서 리스트에 추가
+                # (행마다 딕셔너리를 만들지 않고 엑셀 행으로 바로 쓸 수 있는 형태로 보관)
+                video_details.append((
                     # 전체 검색 결과 기준 Index (페이지가 넘어가도 이어지도록 보정)
-                    'Index': index + total_results_fetched,
-                    'Title': title,
-                    'Channel Title': channel_title,
-                    # 채널 ID도 함께 엑셀에 저장되도록 컬럼 추가
-                    'Channel ID': channel_id_value,
-                    'Duration': duration,
-                    'Views': views,
-                    'Comments': comments,
-                    'URL': video_url,
-                    'Thumbnail URL': thumbnail_url,
-                    'Tags': ', '.join(tags),
-                    'Published Date': published_date
-                })
-
-        # 이번 페이지에서 가져온 동영상 개수를 누적
-        total_results_fetched += len(search_results.get('items', []))
-
-        # 더 이상 다음 페이지가 없거나, 임의로 정한 최대 개수(200개) 이상이면 반복 종료
-        if not next_page_token or total_results_fetched >= 200:
-            break
+                    index + page_offset,
+                    title,
+                    channel_title,
+                    channel_id_value,
+                    duration,
+                    views,
+                    comments,
+                    video_url,
+                    thumbnail_url,
+                    ', '.join(tags),
+                    published_date,
+                ))
+    finally:
+        # 작업이 끝나면(오류 포함) 작업 스레드와 세션이 잡고 있는 연결을 정리
+        executor.shutdown(wait=True)
+        session.close()
 
     return video_details
 
 
+def save_videos_to_excel(videos, file_path):
+    """
+    fetch_youtube_data가 반환한 동영상 정보 리스트를 엑셀 파일로 저장하는 함수입니다.
+
+    서식이 없는 단순한 표 형태이므로 openpyxl(셀 단위 순수 파이썬 처리) 대신
+    XML을 한 번에 써 내려가는 pyexcelerate를 사용하여 저장 속도를 높입니다.
+    """
+    # 첫 행은 컬럼명(헤더), 이후 행은 동영상별 값 튜플을 그대로 사용
+    # (판다스 DataFrame이나 행별 딕셔너리를 거치지 않아 복사본 생성을 줄임)
+    rows = [VIDEO_COLUMNS] + videos
+
+    wb = Workbook()
+    ws = wb.new_sheet("videos", data=rows)
+    # 업로드 날짜는 숫자(일련번호)가 아닌 날짜로 보이도록 열 서식을 지정 (pyexcelerate 열 번호는 1부터 시작)
+    date_col = VIDEO_COLUMNS.index('Published Date') + 1
+    ws.set_col_style(date_col, Style(format=Format('yyyy-mm-dd')))
+    wb.save(file_path)
+
+
 def run_gui():
     """
     간단한 Tkinter 기반 GUI를 통해
@@ -205,22 +341,73 @@ def run_gui():
 
     # ------------------------- 이벤트 핸들러 함수 정의 -------------------------
 
+    # 작업 스레드 -> GUI(메인 스레드)로 전달할 메시지 큐
+    # Tkinter 위젯은 메인 스레드에서만 다뤄야 하므로, 작업 스레드는 큐에 넣기만 하고
+    # 실제 화면 반영은 메인 스레드의 drain_queue가 주기적으로 처리합니다.
+    # 메시지 형식: ("log", 문자열) / ("info" 또는 "error", (제목, 내용)) / ("done", None)
+    ui_queue = queue.Queue()
+    # 조회 작업이 진행 중인지 여부 (엔터 키 바인딩 등으로 중복 실행되는 것을 방지)
+    is_running = False
+
     def log_message(message: str):
         """
-        진행 상황이나 오류 메시지를 하단 텍스트 박스에 출력하는 함수입니다.
+        진행 상황이나 오류 메시지를 하단 텍스트 박스에 출력하도록 큐에 넣는 함수입니다.
+        작업 스레드에서도 안전하게 호출할 수 있습니다.
         """
+        ui_queue.put(("log", message))
+
+    def drain_queue():
+        """
+        메시지 큐에 쌓인 내용을 메인 스레드에서 한 번에 화면에 반영하는 함수입니다.
+        0.1초마다 root.after로 다시 호출됩니다.
+        """
+        nonlocal is_running
+        lines = []
+        while True:
+            try:
+                kind, payload = ui_queue.get_nowait()
+            except queue.Empty:
+                break
+
+            if kind == "log":
+                lines.append(payload + "\n")
+                continue
+
+            # 팝업이나 완료 처리 전에, 그때까지 모인 로그를 먼저 화면에 반영
+            append_log_lines(lines)
+            lines = []
+            if kind == "info":
+                messagebox.showinfo(*payload)
+            elif kind == "error":
+                messagebox.showerror(*payload)
+            elif kind == "done":
+                # 처리 완료 후 버튼 다시 활성화
+                is_running = False
+                run_button.config(state="normal")
+
+        append_log_lines(lines)
+        root.after(100, drain_queue)
+
+    def append_log_lines(lines):
+        """
+        여러 줄의 로그를 한 번의 insert로 텍스트 박스에 추가하는 함수입니다.
+        """
+        if not lines:
+            return
         status_text.configure(state="normal")
-        status_text.insert(tk.END, message + "\n")
+        status_text.insert(tk.END, "".join(lines))
         status_text.see(tk.END)
         status_text.configure(state="disabled")
-        # 즉시 화면에 반영되도록 업데이트
-        root.update_idletasks()
 
     def on_run_button_click():
         """
         '검색 및 저장' 버튼 클릭 시 호출되는 콜백 함수입니다.
         입력값을 검증한 뒤, 유튜브 API를 호출하고 엑셀로 저장합니다.
         """
+        nonlocal is_running
+        # 이미 조회 작업이 진행 중이면 무시 (엔터 키로 호출되는 경우 포함)
+        if is_running:
+            return
         # 버튼 중복 클릭 방지를 위해 비활성화
         run_button.config(state="disabled")
         # 이전 로그를 지우고 새 로그 출력 준비
@@ -280,6 +467,20 @@ def run_gui():
 
         log_message("유튜브 데이터 조회를 시작합니다...")
 
+        # 네트워크 작업은 별도 스레드에서 실행하여 조회 중에도 GUI가 멈추지 않도록 합니다.
+        is_running = True
+        worker = threading.Thread(
+            target=run_fetch_job,
+            args=(api_key, search_query, channel_id, start_date_str, end_date_str, file_name),
+            daemon=True,
+        )
+        worker.start()
+
+    def run_fetch_job(api_key, search_query, channel_id, start_date_str, end_date_str, file_name):
+        """
+        작업 스레드에서 유튜브 데이터를 조회하고 엑셀로 저장하는 함수입니다.
+        화면 갱신(로그, 팝업, 버튼 상태)은 모두 ui_queue를 통해 메인 스레드에 요청합니다.
+        """
         try:
             # ------------------------- 유튜브 데이터 조회 -------------------------
             # 기존에 정의된 fetch_youtube_data 함수를 호출하여 결과를 가져옵니다.
@@ -294,14 +495,12 @@ def run_gui():
 
             # 수집된 동영상 정보가 하나라도 있는 경우에만 엑셀로 저장
             if videos:
-                # 리스트 형태의 동영상 정보를 판다스 DataFrame으로 변환
-                df = pd.DataFrame(videos)
                 # 오늘 날짜를 파일명에 포함 (예: 2026-02-11)
                 today_date = datetime.now().strftime("%Y-%m-%d")
                 # 최종 엑셀 파일 경로/이름 구성
                 file_path = f"{file_name}_{today_date}.xlsx"
-                # 인덱스 컬럼 없이 저장
-                df.to_excel(file_path, index=False)
+                # 동영상 정보를 엑셀 파일로 저장
+                save_videos_to_excel(videos, file_path)
 
                 log_message(f"엑셀 파일 저장 완료: {file_path}")
 
@@ -327,22 +526,22 @@ def run_gui():
                     log_message(f"[경고] 엑셀 파일 자동 열기에 실패했습니다: {e}")
 
                 # 성공 메시지 팝업
-                messagebox.showinfo(
-                    "완료",
-                    f"데이터를 엑셀 파일로 저장했습니다.\n\n파일명: {file_path}",
-                )
+                ui_queue.put((
+                    "info",
+                    ("완료", f"데이터를 엑셀 파일로 저장했습니다.\n\n파일명: {file_path}"),
+                ))
             else:
                 # 검색 결과가 하나도 없는 경우
                 log_message("검색 결과가 없어 엑셀 파일을 생성하지 않습니다.")
-                messagebox.showinfo("알림", "검색 결과가 없습니다.")
+                ui_queue.put(("info", ("알림", "검색 결과가 없습니다.")))
 
         except Exception as e:
             # 예외 발생 시 에러 메시지를 로그와 팝업으로 표시
             log_message(f"[에러] 데이터 조회 또는 저장 중 오류가 발생했습니다: {e}")
-            messagebox.showerror("에러", f"데이터 조회 또는 저장 중 오류가 발생했습니다.\n\n{e}")
+            ui_queue.put(("error", ("에러", f"데이터 조회 또는 저장 중 오류가 발생했습니다.\n\n{e}")))
         finally:
-            # 처리 완료 후 버튼 다시 활성화
-            run_button.config(state="normal")
+            # 작업 완료를 메인 스레드에 알림 (버튼 다시 활성화)
+            ui_queue.put(("done", None))
 
     # ------------------------- 메인 윈도우 생성 -------------------------
     root = tk.Tk()
@@ -416,6 +615,9 @@ def run_gui():
     # 엔터 키로도 버튼이 눌리도록 바인딩
     root.bind("<Return>", lambda event: on_run_button_click())
 
+    # 작업 스레드에서 보낸 로그/팝업 메시지를 주기적으로 처리
+    root.after(100, drain_queue)
+
     # 메인 이벤트 루프 시작
     root.mainloop()
 
@@ -55,22 +55,33 @@ from openai import OpenAI
 import os
 from dotenv import load_dotenv
 import re
-from urllib.parse import urlparse, parse_qs
 import requests
 import tkinter as tk
 from tkinter import ttk, filedialog, messagebox
 from threading import Thread
-from openpyxl import Workbook, load_workbook
-from openpyxl.styles import Alignment
-from openpyxl.utils import get_column_letter
+import xlsxwriter
 import subprocess
 import platform
+import queue
 import time
 from datetime import datetime
-import asyncio
-import aiohttp
+from concurrent.futures import ThreadPoolExecutor, as_completed
+import functools
+import hashlib
+import sqlite3
+import threading
+
+# 엑셀 일괄 처리 시 동시에 처리할 최대 동영상 개수
+# (YouTube Data API / OpenAI 요청이 동시에 너무 많이 몰리지 않도록 제한)
+MAX_CONCURRENT_VIDEOS = 8
+
+# 결과 엑셀 파일의 열 구성
+RESULT_COLUMNS = ['제목', 'URL', '원본 자막', 'GPT 요약']
 
 # 환경 변수 로드 및 검증
+# (성공한 결과는 캐시하여 동영상마다 .env 파일을 다시 읽지 않도록 함.
+#  키가 없어 예외가 발생한 경우는 캐시되지 않으므로 .env 수정 후 다시 시도 가능)
+@functools.lru_cache(maxsize=1)
 def load_api_keys():
     """API 키 로드 및 유효성 검사"""
     load_dotenv()
@@ -85,6 +96,108 @@ def load_api_keys():
     
     return api_keys
 
+# OpenAI 클라이언트는 처음 사용할 때 한 번만 만들어서 모든 작업 스레드가 공유
+# (동영상마다 클라이언트를 새로 만들지 않고 HTTP 연결 풀도 재사용)
+@functools.lru_cache(maxsize=1)
+def get_openai_client():
+    """공유 OpenAI 클라이언트를 반환합니다."""
+    return OpenAI(api_key=load_api_keys()['openai'])
+
+# YouTube Data API 호출에 사용할 HTTP 세션도 한 번만 만들어서 공유 (keep-alive 연결 재사용)
+@functools.lru_cache(maxsize=1)
+def get_http_session():
+    """공유 requests.Session을 반환합니다."""
+    return requests.Session()
+
+# YouTube URL에서 비디오 ID(11자)를 추출하기 위한 정규식 (모듈 로드 시 한 번만 컴파일)
+# - youtu.be/VIDEO_ID, shorts/VIDEO_ID, ?v=VIDEO_ID 또는 &v=VIDEO_ID 형식 지원
+_VIDEO_ID_RE = re.compile(r'(?:youtu\.be/|shorts/|[?&]v=)([A-Za-z0-9_-]{11})')
+
+# 자막에서 내용 없이 자주 나오는 효과음 표시 (자막 결합 시 제외)
+_TRANSCRIPT_SKIP_TEXTS = frozenset({"[Music]", "[Applause]", "[음악]", "[박수]"})
+
+# 캐시에 저장하는 자막의 종류 이름
+# (나중에 자막 결합 방식이 바뀌면 이름을 바꿔서, 이전 방식으로 결합해 저장한 자막을 다시 쓰지 않도록 함)
+TRANSCRIPT_CACHE_KIND = 'transcript'
+
+# GPT 요약 요청에 보낼 자막의 최대 글자 수
+# (매우 긴 동영상의 자막이 모델의 컨텍스트 한도를 넘어 요청이 실패하지 않도록 제한)
+MAX_SUMMARY_INPUT_CHARS = 100000
+
+# GPT 요약 요청 설정 (요약 캐시 키에도 함께 포함되므로, 바꾸면 이전 요약은 재사용되지 않음)
+SUMMARY_MODEL = "gpt-4o"
+SUMMARY_SYSTEM_PROMPT = (
+    "You are a helpful assistant that summarizes YouTube video transcripts. "
+    "If the transcript is in Korean, summarize it in Korean. "
+    "If it's in English, translate and summarize it in Korean."
+)
+SUMMARY_USER_PROMPT = "Please summarize the following video transcript:\n\n{transcript}"
+SUMMARY_TEMPERATURE = 0.7
+SUMMARY_MAX_TOKENS = 1000
+
+# 조회 결과 캐시 파일 경로 (사용자 홈 폴더에 저장되어 프로그램을 다시 실행해도 유지)
+CACHE_DB_PATH = os.path.join(os.path.expanduser("~"), ".youtube_summary_cache.sqlite3")
+
+# 캐시에 저장한 비디오 제목의 유효 기간 (초, 7일)
+# (제목은 업로드 후에도 바뀔 수 있으므로, 오래된 제목은 다시 조회)
+TITLE_CACHE_MAX_AGE = 7 * 24 * 60 * 60
+
+# 같은 실행 중에 이미 가져온 비디오 제목 (video_id -> 제목)
+_title_memory_cache = {}
+
+# 캐시 DB 연결과 여러 스레드에서 동시에 접근하지 않도록 보호하는 잠금
+_cache_conn = None
+_cache_lock = threading.Lock()
+
+def _get_cache_connection():
+    """캐시 DB 연결을 반환합니다. (처음 호출 시 파일과 테이블 생성)"""
+    global _cache_conn
+    if _cache_conn is None:
+        _cache_conn = sqlite3.connect(CACHE_DB_PATH, check_same_thread=False)
+        # WAL 모드: 쓰기 중에도 읽기가 막히지 않도록 설정
+        _cache_conn.execute("PRAGMA journal_mode=WAL")
+        _cache_conn.execute(
+            "CREATE TABLE IF NOT EXISTS cache ("
+            "kind TEXT NOT NULL, key TEXT NOT NULL, value TEXT NOT NULL, "
+            "updated_at REAL NOT NULL, "
+            "PRIMARY KEY (kind, key))"
+        )
+        _cache_conn.commit()
+    return _cache_conn
+
+def cache_get(kind, key, max_age=None):
+    """
+    캐시에서 값을 조회합니다. 없거나 캐시를 읽을 수 없으면 None을 반환합니다.
+
+    kind: 캐시 종류 ('title', TRANSCRIPT_CACHE_KIND, 'summary')
+    key: 조회 키 (비디오 ID 등)
+    max_age: 지정하면 저장한 지 max_age초가 지난 값은 없는 것으로 처리
+    """
+    try:
+        with _cache_lock:
+            row = _get_cache_connection().execute(
+                "SELECT value, updated_at FROM cache WHERE kind = ? AND key = ?", (kind, key)
+            ).fetchone()
+        if row is None or (max_age is not None and time.time() - row[1] > max_age):
+            return None
+        return row[0]
+    except sqlite3.Error as e:
+        print(f"캐시 조회 중 오류 발생: {str(e)}")
+        return None
+
+def cache_set(kind, key, value):
+    """캐시에 값을 저장합니다. (캐시 저장 실패는 처리 결과에 영향을 주지 않음)"""
+    try:
+        with _cache_lock:
+            conn = _get_cache_connection()
+            conn.execute(
+                "INSERT OR REPLACE INTO cache (kind, key, value, updated_at) VALUES (?, ?, ?, ?)",
+                (kind, key, value, time.time())
+            )
+            conn.commit()
+    except sqlite3.Error as e:
+        print(f"캐시 저장 중 오류 발생: {str(e)}")
+
 def extract_video_id(url):
     """
     다양한 형식의 YouTube URL에서 비디오 ID를 추출합니다.
@@ -94,31 +207,54 @@ def extract_video_id(url):
     - https://youtu.be/VIDEO_ID
     - https://youtube.com/shorts/VIDEO_ID
     """
-    try:
-        if not url or not isinstance(url, str):
-            return None
-        
-        # shorts URL 처리
-        if 'shorts' in url:
-            shorts_match = re.search(r'shorts/([a-zA-Z0-9_-]+)', url)
-            if shorts_match:
-                return shorts_match.group(1)
-        
-        # 일반적인 YouTube URL 처리
-        if 'youtu.be' in url:
-            return url.split('/')[-1].split('?')[0]
-        elif 'youtube.com' in url:
-            parsed_url = urlparse(url)
-            if parsed_url.query:
-                return parse_qs(parsed_url.query).get('v', [None])[0]
-        
-        return None
-    except Exception as e:
-        print(f"URL 파싱 중 오류 발생: {str(e)}")
+    # 엑셀의 빈 셀(NaN) 등 문자열이 아닌 값은 처리하지 않음
+    if not url or not isinstance(url, str):
         return None
+    
+    # 미리 컴파일한 정규식 한 번으로 비디오 ID(11자)를 찾음
+    match = _VIDEO_ID_RE.search(url)
+    return match.group(1) if match else None
+
+def get_video_title(video_id, use_cache=False):
+    """
+    비디오 제목 가져오기 (get_video_titles에 ID 하나만 넘겨서 처리)
+    """
+    return get_video_titles([video_id], use_cache)[video_id]
+
+def get_video_titles(video_ids, use_cache=False):
+    """
+    여러 비디오의 제목을 한꺼번에 가져오기
 
-async def get_video_title_async(video_id):
-    """비동기 방식으로 비디오 제목 가져오기"""
+    videos.list API는 요청 한 번에 최대 50개의 ID를 조회할 수 있으므로
+    50개씩 묶어서 요청합니다. (요청 수와 API 할당량 사용량이 최대 1/50로 감소)
+
+    같은 실행 중에 이미 가져온 제목은 다시 요청하지 않으며,
+    use_cache가 True이면 이전 실행에서 저장한 제목도 캐시 파일에서 재사용합니다.
+
+    반환값: {video_id: 제목} (제목을 가져오지 못한 경우 안내 문구)
+    """
+    titles = {}
+    missing_ids = []
+    # 중복 ID는 한 번만 조회 (입력 순서 유지)
+    for video_id in dict.fromkeys(video_ids):
+        if video_id in _title_memory_cache:
+            titles[video_id] = _title_memory_cache[video_id]
+            continue
+        if use_cache:
+            cached_title = cache_get('title', video_id, TITLE_CACHE_MAX_AGE)
+            if cached_title is not None:
+                _title_memory_cache[video_id] = cached_title
+                titles[video_id] = cached_title
+                continue
+        missing_ids.append(video_id)
+
+    # 캐시에 없는 ID만 50개씩 묶어서 요청 (공유 세션으로 연결 재사용)
+    for i in range(0, len(missing_ids), 50):
+        titles.update(_fetch_titles_chunk(missing_ids[i:i + 50], use_cache))
+    return titles
+
+def _fetch_titles_chunk(video_ids, use_cache):
+    """videos.list API 한 번으로 최대 50개 비디오의 제목을 조회합니다. (실패 시 재시도)"""
     max_retries = 3
     retry_delay = 1
     
@@ -127,60 +263,117 @@ async def get_video_title_async(video_id):
             api_keys = load_api_keys()
             youtube_api_key = api_keys['youtube']
             
-            async with aiohttp.ClientSession() as session:
-                url = f"https://www.googleapis.com/youtube/v3/videos?part=snippet&id={video_id}&key={youtube_api_key}"
-                async with session.get(url) as response:
-                    if response.status == 200:
-                        data = await response.json()
-                        if 'items' in data and len(data['items']) > 0:
-                            return data['items'][0]['snippet']['title']
-                    return "제목을 가져올 수 없습니다"
-                    
+            params = {'part': 'snippet', 'id': ','.join(video_ids), 'key': youtube_api_key}
+            response = get_http_session().get("https://www.googleapis.com/youtube/v3/videos", params=params, timeout=10)
+            # 응답에 없는 비디오(삭제/비공개 등)는 안내 문구로 표시
+            titles = dict.fromkeys(video_ids, "제목을 가져올 수 없습니다")
+            if response.status_code == 200:
+                data = response.json()
+                for item in data.get('items', []):
+                    title = item['snippet']['title']
+                    titles[item['id']] = title
+                    # 정상적으로 가져온 제목만 캐시에 저장
+                    _title_memory_cache[item['id']] = title
+                    if use_cache:
+                        cache_set('title', item['id'], title)
+            return titles
+                
         except Exception as e:
             if attempt < max_retries - 1:
-                await asyncio.sleep(retry_delay)
+                time.sleep(retry_delay)
                 continue
-            return f"제목 가져오기 실패: {str(e)}"
+            return dict.fromkeys(video_ids, f"제목 가져오기 실패: {str(e)}")
+
+def summarize_text(full_text, use_cache=False):
+    """
+    GPT-4o로 자막 텍스트를 요약합니다.
+
+    공유 클라이언트(get_openai_client)를 사용하므로, 여러 작업 스레드의 요약 요청이
+    하나의 연결 풀을 통해 동시에 진행됩니다.
+    use_cache가 True이면 같은 요청(모델, 프롬프트, 생성 설정, 실제로 보내는 자막의
+    SHA-256 해시 기준)에 대해 이전에 만든 요약을 재사용하여 GPT 호출(비용)을 생략합니다.
+    """
+    # 너무 긴 자막은 앞부분만 요약에 사용
+    if len(full_text) > MAX_SUMMARY_INPUT_CHARS:
+        print(f"자막이 너무 길어 앞부분 {MAX_SUMMARY_INPUT_CHARS}자만 요약에 사용합니다.")
+        full_text = full_text[:MAX_SUMMARY_INPUT_CHARS]
+    
+    messages = [
+        {"role": "system", "content": SUMMARY_SYSTEM_PROMPT},
+        {"role": "user", "content": SUMMARY_USER_PROMPT.format(transcript=full_text)}
+    ]
+    
+    # 요청 내용 전체를 캐시 키로 사용 (모델이나 프롬프트가 바뀌면 새로 요약)
+    request_key = "\0".join((SUMMARY_MODEL, str(SUMMARY_TEMPERATURE), str(SUMMARY_MAX_TOKENS),
+                             SUMMARY_SYSTEM_PROMPT, messages[1]["content"]))
+    request_hash = hashlib.sha256(request_key.encode('utf-8')).hexdigest()
+    if use_cache:
+        cached_summary = cache_get('summary', request_hash)
+        if cached_summary is not None:
+            print("캐시에 저장된 요약을 사용합니다.")
+            return cached_summary
+    
+    # 공유 OpenAI 클라이언트 가져오기 (API 키 확인 포함)
+    client = get_openai_client()
+    
+    print(f"{SUMMARY_MODEL}를 사용하여 요약하는 중...")
+    
+    # GPT를 사용하여 요약 생성
+    response = client.chat.completions.create(
+        model=SUMMARY_MODEL,
+        messages=messages,
+        temperature=SUMMARY_TEMPERATURE,
+        max_tokens=SUMMARY_MAX_TOKENS
+    )
+    
+    print("요약이 완료되었습니다.")
+    summary = response.choices[0].message.content
+    if use_cache:
+        cache_set('summary', request_hash, summary)
+    return summary
 
-async def get_video_summary_async(video_id):
-    """비동기 방식으로 비디오 요약 가져오기"""
+def _fetch_transcript_text(video_id, languages):
+    """
+    자막을 가져와 하나의 텍스트로 결합합니다.
+    """
+    transcript = YouTubeTranscriptApi.get_transcript(video_id, languages=languages)
+    # 자막 텍스트 결합 (빈 줄과 [음악] 같은 효과음 표시는 제외하여 GPT에 보내는 토큰을 줄임)
+    return " ".join(
+        text for entry in transcript
+        if (text := entry['text'].strip()) and text not in _TRANSCRIPT_SKIP_TEXTS
+    )
+
+def get_video_summary(video_id, use_cache=False):
+    """
+    비디오 요약 가져오기 (ThreadPoolExecutor의 작업 스레드에서 호출됨)
+
+    use_cache가 True이면 이전 실행에서 저장한 자막 텍스트와 요약을 재사용하여
+    자막 다운로드와 GPT 호출을 건너뜁니다.
+    """
     try:
-        print(f"\n자막을 가져오는 중... (video_id: {video_id})")
-        
-        # 한국어 자막 우선 시도, 실패 시 영어 자막 시도
-        try:
-            transcript = YouTubeTranscriptApi.get_transcript(video_id, languages=['ko'])
-        except NoTranscriptFound:
+        full_text = cache_get(TRANSCRIPT_CACHE_KIND, video_id) if use_cache else None
+
+        if full_text is not None:
+            print(f"\n캐시에 저장된 자막을 사용합니다. (video_id: {video_id})")
+        else:
+            print(f"\n자막을 가져오는 중... (video_id: {video_id})")
+            
+            # 한국어 자막 우선 시도, 실패 시 영어 자막 시도
             try:
-                transcript = YouTubeTranscriptApi.get_transcript(video_id, languages=['en'])
+                full_text = _fetch_transcript_text(video_id, ['ko'])
             except NoTranscriptFound:
-                return "", "이 비디오에 대한 자막을 찾을 수 없습니다."
-        
-        print("자막을 성공적으로 가져왔습니다.")
-        
-        # 자막 텍스트 결합
-        full_text = " ".join([entry['text'] for entry in transcript])
-        
-        # OpenAI API 키 확인
-        api_keys = load_api_keys()
-        client = OpenAI(api_key=api_keys['openai'])
-        
-        print("GPT-4o를 사용하여 요약하는 중...")
-        
-        # GPT를 사용하여 요약 생성
-        response = await asyncio.to_thread(
-            client.chat.completions.create,
-            model="gpt-4o",
-            messages=[
-                {"role": "system", "content": "You are a helpful assistant that summarizes YouTube video transcripts. If the transcript is in Korean, summarize it in Korean. If it's in English, translate and summarize it in Korean."},
-                {"role": "user", "content": f"Please summarize the following video transcript:\n\n{full_text}"}
-            ],
-            temperature=0.7,
-            max_tokens=1000
-        )
+                try:
+                    full_text = _fetch_transcript_text(video_id, ['en'])
+                except NoTranscriptFound:
+                    return "", "이 비디오에 대한 자막을 찾을 수 없습니다."
+            
+            print("자막을 성공적으로 가져왔습니다.")
+            
+            if use_cache:
+                cache_set(TRANSCRIPT_CACHE_KIND, video_id, full_text)
         
-        print("요약이 완료되었습니다.")
-        return full_text, response.choices[0].message.content
+        summary = summarize_text(full_text, use_cache)
+        return full_text, summary
         
     except TranscriptsDisabled:
         print(f"오류: {video_id}의 스크립트가 비활성화되어 있습니다.")
@@ -189,9 +382,12 @@ async def get_video_summary_async(video_id):
         print(f"오류 발생: {str(e)}")
         return "", f"오류가 발생했습니다: {str(e)}"
 
-def save_excel_with_formatting(df, output_file):
+class ExcelResultWriter:
     """
-    데이터프레임을 엑셀 파일로 저장하고 보기 좋게 서식을 적용합니다.
+    요약 결과를 서식이 적용된 엑셀 파일로 한 행씩 바로 기록하는 클래스
+
+    xlsxwriter의 constant_memory 모드를 사용하므로, 기록한 행은 즉시 디스크로 내보내지고
+    전체 결과를 메모리에 모아 둘 필요가 없습니다. (행은 위에서부터 순서대로만 기록 가능)
     
     적용되는 서식:
     - 열 너비 자동 조정
@@ -199,48 +395,113 @@ def save_excel_with_formatting(df, output_file):
     - 셀 정렬
     - 헤더 스타일링
     """
+    # 열 너비 설정
+    COLUMN_WIDTHS = {
+        '제목': 40,
+        'URL': 30,
+        '원본 자막': 60,
+        'GPT 요약': 60
+    }
+    # 자동 줄 바꿈을 적용할 열
+    WRAP_COLUMNS = frozenset({'원본 자막', 'GPT 요약'})
+    # 엑셀 셀 하나에 넣을 수 있는 최대 글자 수 (xlsxwriter는 넘는 부분을 잘라서 기록하고 -2를 반환)
+    MAX_CELL_CHARS = 32767
+
+    def __init__(self, output_file, columns, log=print):
+        """
+        엑셀 파일을 만들고 열 서식과 헤더 행을 기록
+        log: 셀 길이 제한으로 내용이 잘렸을 때 경고를 남길 함수 (GUI에서는 log_message)
+        """
+        self.columns = list(columns)
+        self.log = log
+        self.workbook = xlsxwriter.Workbook(output_file, {
+            # 행을 쓰는 즉시 디스크로 내보내 메모리 사용량을 일정하게 유지
+            'constant_memory': True,
+            # URL 문자열을 하이퍼링크로 자동 변환하지 않고 일반 텍스트로 저장
+            'strings_to_urls': False,
+        })
+        self.worksheet = self.workbook.add_worksheet()
+        # 지금까지 기록한 데이터 행 개수
+        self.rows_written = 0
+        
+        # 서식 객체는 한 번만 만들어서 재사용
+        header_format = self.workbook.add_format({
+            'bold': True, 'border': 1,
+            'align': 'center', 'valign': 'vcenter', 'text_wrap': True
+        })
+        wrap_format = self.workbook.add_format({'valign': 'top', 'text_wrap': True})
+        top_format = self.workbook.add_format({'valign': 'top'})
+        
+        # 모든 열에 대해 열 단위로 너비와 서식을 한 번에 지정
+        # (원본 자막과 GPT 요약 열에만 자동 줄 바꿈 적용)
+        for idx, col in enumerate(self.columns):
+            col_format = wrap_format if col in self.WRAP_COLUMNS else top_format
+            self.worksheet.set_column(idx, idx, self.COLUMN_WIDTHS.get(col, 30), col_format)
+        
+        # 첫 번째 행(헤더) 작성
+        self.worksheet.write_row(0, 0, self.columns, header_format)
+
+    def write_row(self, values):
+        """
+        데이터 한 행을 다음 줄에 기록 (빈 값은 빈 셀로 저장, 서식은 열 서식을 그대로 사용)
+        셀 최대 길이를 넘어 잘린 값이 있으면 경고를 남깁니다.
+        """
+        self.rows_written += 1
+        # worksheet.write_row는 셀 하나라도 오류(-2: 잘림)가 나면 나머지 셀을 기록하지 않으므로 셀마다 기록
+        for col, value in enumerate(values):
+            if self.worksheet.write(self.rows_written, col, "" if pd.isna(value) else value) == -2:
+                self.log(
+                    f"경고: {self.rows_written}번째 행의 '{self.columns[col]}' 내용({len(value):,}자)이 "
+                    f"엑셀 셀 최대 길이({self.MAX_CELL_CHARS:,}자)를 넘어 잘려서 저장되었습니다."
+                )
+
+    def close(self):
+        """파일 저장 및 마무리"""
+        self.workbook.close()
+
+def read_input_urls(input_file):
+    """
+    입력 엑셀 파일에서 'URL' 열만 읽어옵니다.
+
+    Rust로 구현된 calamine 엔진으로 빠르게 읽고, 다른 열은 파싱하지 않으며
+    값은 문자열 그대로 읽어 자료형 추론을 생략합니다.
+    (python-calamine이 설치되지 않았거나, calamine 엔진을 지원하지 않는 pandas 2.2 미만
+     버전에서는 기본 엔진으로 읽음)
+    """
     try:
-        # 엑셀 파일로 저장
-        df.to_excel(output_file, index=False)
-        
-        # openpyxl로 파일을 열어서 서식 적용
-        wb = load_workbook(output_file)
-        ws = wb.active
-        
-        # 열 너비 설정
-        column_widths = {
-            '제목': 40,
-            'URL': 30,
-            '원본 자막': 60,
-            'GPT 요약': 60
-        }
-        
-        # 모든 열에 대해 서식 적용
-        for idx, col in enumerate(df.columns, 1):
-            column_letter = get_column_letter(idx)
-            
-            # 열 너비 설정
-            ws.column_dimensions[column_letter].width = column_widths.get(col, 30)
-            
-            # 첫 번째 행(헤더) 서식 설정
-            header_cell = ws[f"{column_letter}1"]
-            header_cell.alignment = Alignment(horizontal='center', vertical='center', wrap_text=True)
-            
-            # 데이터 행 서식 설정
-            for row in range(2, len(df) + 2):
-                cell = ws[f"{column_letter}{row}"]
-                
-                # 원본 자막과 GPT 요약 열에만 자동 줄 바꿈 적용
-                if col in ['원본 자막', 'GPT 요약']:
-                    cell.alignment = Alignment(vertical='top', wrap_text=True)
-                else:
-                    cell.alignment = Alignment(vertical='top')
+        return pd.read_excel(input_file, engine='calamine', usecols=['URL'], dtype=str)
+    except (ImportError, ValueError):
+        # ImportError: python-calamine 미설치, ValueError: 'Unknown engine: calamine' (pandas < 2.2)
+        return pd.read_excel(input_file, usecols=['URL'], dtype=str)
+
+def save_excel_with_formatting(df, output_file, log=print):
+    """
+    데이터프레임을 엑셀 파일로 저장하고 보기 좋게 서식을 적용합니다.
+    (서식 내용과 log 인자는 ExcelResultWriter 참고)
+    """
+    try:
+        writer = ExcelResultWriter(output_file, df.columns, log)
+        for values in df.itertuples(index=False, name=None):
+            writer.write_row(values)
         
         # 변경사항 저장
-        wb.save(output_file)
+        writer.close()
     except Exception as e:
         raise Exception(f"엑셀 파일 저장 중 오류 발생: {str(e)}")
 
+# 파일을 여는 방법은 실행 중에 바뀌지 않으므로 모듈을 불러올 때 한 번만 결정
+if platform.system() == 'Windows':
+    _open_with_default_app = os.startfile
+else:
+    _OPEN_COMMAND = 'open' if platform.system() == 'Darwin' else 'xdg-open'  # macOS / Linux
+
+    def _open_with_default_app(filepath):
+        # 뷰어가 실행될 때까지 기다리지 않도록 Popen으로 실행만 시키고 바로 반환
+        # (프로그램과 별도 세션으로 실행하고, 종료된 자식 프로세스가 좀비로 남지 않도록
+        #  데몬 스레드에서 종료를 기다려 회수)
+        process = subprocess.Popen([_OPEN_COMMAND, filepath], start_new_session=True)
+        Thread(target=process.wait, daemon=True).start()
+
 def open_file(filepath):
     """
     운영체제에 따라 적절한 방법으로 파일을 엽니다.
@@ -251,12 +512,7 @@ def open_file(filepath):
     
     for attempt in range(max_retries):
         try:
-            if platform.system() == 'Windows':
-                os.startfile(filepath)
-            elif platform.system() == 'Darwin':  # macOS
-                subprocess.run(['open', filepath])
-            else:  # Linux
-                subprocess.run(['xdg-open', filepath])
+            _open_with_default_app(filepath)
             return True
         except Exception as e:
             if attempt < max_retries - 1:
@@ -307,6 +563,11 @@ class YouTubeSummarizerGUI:
         self.processing = False
         self.max_retries = 3
         self.start_time = None
+        
+        # 작업 스레드에서 보낸 로그/상태 메시지 큐
+        # (메시지마다 화면을 다시 그리지 않고 0.1초마다 모아서 한 번에 반영)
+        self._ui_queue = queue.Queue()
+        self._drain_job = self.root.after(100, self._drain_ui_queue)
 
     def setup_styles(self):
         """스타일 설정"""
@@ -404,28 +665,34 @@ class YouTubeSummarizerGUI:
         ttk.Checkbutton(common_frame, text="완료 후 결과 파일 자동으로 열기", 
                        variable=self.auto_open_var).grid(row=0, column=0, columnspan=3, pady=5)
         
+        # 캐시 사용 체크박스 (이전에 가져온 제목/자막/요약 재사용)
+        # 캐시 파일은 사용자가 직접 켠 경우에만 만들고 사용 (기본값: 사용 안 함)
+        self.use_cache_var = tk.BooleanVar(value=False)
+        ttk.Checkbutton(common_frame, text="이전 조회 결과(제목/자막/요약) 캐시 사용", 
+                       variable=self.use_cache_var).grid(row=1, column=0, columnspan=3, pady=5)
+        
         # 진행 상황 표시
         self.progress_var = tk.DoubleVar()
         self.progress = ttk.Progressbar(common_frame, length=600, mode='determinate', variable=self.progress_var)
-        self.progress.grid(row=1, column=0, columnspan=3, pady=10)
+        self.progress.grid(row=2, column=0, columnspan=3, pady=10)
         
         # 상태 메시지
         self.status_var = tk.StringVar(value="URL을 입력하거나 엑셀 파일을 선택해주세요.")
         self.status_label = ttk.Label(common_frame, textvariable=self.status_var, wraplength=700)
-        self.status_label.grid(row=2, column=0, columnspan=3)
+        self.status_label.grid(row=3, column=0, columnspan=3)
         
         # 로그 창
         self.log_text = tk.Text(common_frame, height=10, width=80)
-        self.log_text.grid(row=3, column=0, columnspan=3, pady=10)
+        self.log_text.grid(row=4, column=0, columnspan=3, pady=10)
         
         # 로그 스크롤바
         log_scrollbar = ttk.Scrollbar(common_frame, orient="vertical", command=self.log_text.yview)
-        log_scrollbar.grid(row=3, column=3, sticky="ns")
+        log_scrollbar.grid(row=4, column=3, sticky="ns")
         self.log_text.configure(yscrollcommand=log_scrollbar.set)
         
         # 하단 버튼 프레임
         bottom_frame = ttk.Frame(common_frame)
-        bottom_frame.grid(row=4, column=0, columnspan=3, pady=10)
+        bottom_frame.grid(row=5, column=0, columnspan=3, pady=10)
         
         # 프로그램 종료 버튼
         self.exit_button = ttk.Button(bottom_frame, 
@@ -443,6 +710,7 @@ class YouTubeSummarizerGUI:
             self.processing = False
             self.log_message("사용자가 프로그램을 종료했습니다.")
         
+        self.root.after_cancel(self._drain_job)
         self.root.quit()
         self.root.destroy()
 
@@ -482,19 +750,103 @@ class YouTubeSummarizerGUI:
             self.url_output_var.set(filename)
 
     def log_message(self, message):
-        """로그 메시지 추가"""
-        timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        self.log_text.insert(tk.END, f"[{timestamp}] {message}\n")
-        self.log_text.see(tk.END)
-        self.root.update_idletasks()
+        """
+        로그 메시지 추가 (실제 화면 반영은 _drain_ui_queue에서 처리)
+        시각은 숫자(time.time())로만 기록해 두고, 문자열 변환은 화면에 반영할 때 수행합니다.
+        """
+        self._ui_queue.put(('log', (time.time(), message)))
 
     def update_status(self, message):
-        """상태 메시지 업데이트"""
-        self.status_var.set(message)
-        self.root.update_idletasks()
+        """상태 메시지 업데이트 (실제 화면 반영은 _drain_ui_queue에서 처리)"""
+        self._ui_queue.put(('status', message))
+
+    def update_progress(self, value):
+        """진행률 업데이트 (실제 화면 반영은 _drain_ui_queue에서 처리)"""
+        self._ui_queue.put(('progress', value))
+
+    def show_result(self, text):
+        """URL 처리 결과 표시 (실제 화면 반영은 _drain_ui_queue에서 처리)"""
+        self._ui_queue.put(('result', text))
+
+    def show_message(self, kind, title, message):
+        """알림 창 표시 요청 (kind: 'info' 또는 'error', 메인 스레드에서 표시)"""
+        self._ui_queue.put((kind, (title, message)))
+
+    def schedule_open_file(self, filepath):
+        """결과 파일 자동 열기 요청 (메인 스레드에서 1초 뒤에 실행)"""
+        self._ui_queue.put(('open', filepath))
+
+    def finish_processing(self, mode):
+        """처리가 끝났을 때 버튼 상태 복원 요청 (mode: 'url' 또는 'excel')"""
+        self._ui_queue.put(('done', mode))
+
+    def _drain_ui_queue(self):
+        """
+        큐에 쌓인 메시지를 메인 스레드에서 한 번에 화면에 반영합니다.
+        로그는 한 번의 insert로 추가하고, 상태 메시지와 진행률은 마지막 값만 표시합니다.
+        작업 스레드는 Tk 위젯을 직접 다루지 않고, 결과 표시/알림 창/파일 열기/버튼 복원도
+        모두 이 큐를 통해 요청합니다. (Tk는 스레드 안전하지 않음)
+        """
+        lines = []
+        status = None
+        progress = None
+        # 로그를 먼저 반영한 뒤 요청 순서대로 처리할 작업 (결과 표시, 알림 창 등)
+        actions = []
+        # 같은 초(second)에 남긴 로그는 이미 만든 시각 문자열을 재사용
+        last_second = None
+        timestamp = ""
+        while True:
+            try:
+                kind, message = self._ui_queue.get_nowait()
+            except queue.Empty:
+                break
+            if kind == 'log':
+                logged_at, text = message
+                second = int(logged_at)
+                if second != last_second:
+                    timestamp = time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(second))
+                    last_second = second
+                lines.append(f"[{timestamp}] {text}")
+            elif kind == 'status':
+                status = message
+            elif kind == 'progress':
+                progress = message
+            else:
+                actions.append((kind, message))
+        
+        if lines:
+            self.log_text.insert(tk.END, "\n".join(lines) + "\n")
+            self.log_text.see(tk.END)
+        if status is not None:
+            self.status_var.set(status)
+        if progress is not None:
+            self.progress_var.set(progress)
+        
+        for kind, message in actions:
+            if kind == 'result':
+                self.result_text.delete(1.0, tk.END)
+                self.result_text.insert(tk.END, message)
+            elif kind == 'info':
+                messagebox.showinfo(*message)
+            elif kind == 'error':
+                messagebox.showerror(*message)
+            elif kind == 'open':
+                self.root.after(1000, open_file, message)
+            elif kind == 'done':
+                if message == 'url':
+                    self.url_start_button.state(['!disabled'])
+                    self.url_stop_button.state(['disabled'])
+                else:
+                    self.excel_start_button.state(['!disabled'])
+                    self.excel_stop_button.state(['disabled'])
+        
+        self._drain_job = self.root.after(100, self._drain_ui_queue)
 
-    def process_single_url(self, url):
-        """단일 URL 처리"""
+    def process_single_url(self, url, output_file, use_cache, auto_open):
+        """
+        단일 URL 처리 (별도 스레드에서 호출됨)
+        화면의 설정 값(출력 파일, 캐시 사용, 자동 열기)은 시작할 때 메인 스레드에서 읽어서 전달받습니다.
+        """
         try:
             video_id = extract_video_id(url)
             if not video_id:
@@ -502,12 +854,8 @@ class YouTubeSummarizerGUI:
             
             self.log_message(f"Processing URL: {url}")
             
-            # 비동기 함수를 동기적으로 실행
-            loop = asyncio.new_event_loop()
-            asyncio.set_event_loop(loop)
-            title = loop.run_until_complete(get_video_title_async(video_id))
-            original_text, summary = loop.run_until_complete(get_video_summary_async(video_id))
-            loop.close()
+            title = get_video_title(video_id, use_cache)
+            original_text, summary = get_video_summary(video_id, use_cache)
             
             result = f"제목: {title}\n\n"
             result += f"URL: {url}\n\n"
@@ -515,13 +863,6 @@ class YouTubeSummarizerGUI:
             result += f"GPT 요약:\n{summary}\n"
             
             # 결과를 엑셀 파일로 저장
-            output_file = self.url_output_var.get()
-            if not output_file:
-                # 기본 출력 파일명 생성 (입력파일명_요약결과_날짜시간.xlsx)
-                timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-                output_file = f"youtube_summary_{timestamp}.xlsx"
-                self.url_output_var.set(output_file)
-            
             df = pd.DataFrame([{
                 '제목': title,
                 'URL': url,
@@ -529,10 +870,10 @@ class YouTubeSummarizerGUI:
                 'GPT 요약': summary
             }])
             
-            save_excel_with_formatting(df, output_file)
+            save_excel_with_formatting(df, output_file, self.log_message)
             
-            if self.auto_open_var.get():
-                self.root.after(1000, lambda: open_file(output_file))
+            if auto_open:
+                self.schedule_open_file(output_file)
             
             return result
             
@@ -578,8 +919,11 @@ class YouTubeSummarizerGUI:
                 self.progress_var.set(0)
                 self.start_time = datetime.now()
                 
-                # 엑셀 처리 스레드 시작
-                thread = Thread(target=self.process_excel_thread, args=(input_file, output_file))
+                # 엑셀 처리 스레드 시작 (화면의 설정 값은 메인 스레드에서 미리 읽어서 전달)
+                thread = Thread(
+                    target=self.process_excel_thread,
+                    args=(input_file, output_file, self.use_cache_var.get(), self.auto_open_var.get())
+                )
                 thread.daemon = True
                 thread.start()
                 
@@ -595,8 +939,18 @@ class YouTubeSummarizerGUI:
                 self.progress_var.set(0)
                 self.start_time = datetime.now()
                 
-                # URL 처리 스레드 시작
-                thread = Thread(target=self.process_url_thread, args=(url,))
+                output_file = self.url_output_var.get()
+                if not output_file:
+                    # 기본 출력 파일명 생성 (youtube_summary_날짜시간.xlsx)
+                    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+                    output_file = f"youtube_summary_{timestamp}.xlsx"
+                    self.url_output_var.set(output_file)
+                
+                # URL 처리 스레드 시작 (화면의 설정 값은 메인 스레드에서 미리 읽어서 전달)
+                thread = Thread(
+                    target=self.process_url_thread,
+                    args=(url, output_file, self.use_cache_var.get(), self.auto_open_var.get())
+                )
                 thread.daemon = True
                 thread.start()
                 
@@ -605,81 +959,142 @@ class YouTubeSummarizerGUI:
         except Exception as e:
             messagebox.showerror("오류", f"처리 시작 중 오류가 발생했습니다:\n{str(e)}")
 
-    def process_url_thread(self, url):
-        """URL 처리 스레드"""
+    def process_url_thread(self, url, output_file, use_cache, auto_open):
+        """URL 처리 스레드 (화면 갱신은 모두 UI 큐를 통해 요청)"""
         try:
-            self.progress_var.set(20)
+            self.update_progress(20)
             self.update_status("URL 처리 중...")
             
-            result = self.process_single_url(url)
+            result = self.process_single_url(url, output_file, use_cache, auto_open)
             
-            self.progress_var.set(100)
-            self.result_text.delete(1.0, tk.END)
-            self.result_text.insert(tk.END, result)
+            self.update_progress(100)
+            self.show_result(result)
             
             self.update_status("URL 처리가 완료되었습니다!")
             
         except Exception as e:
             self.update_status(f"오류가 발생했습니다: {str(e)}")
             self.log_message(f"심각한 오류 발생: {str(e)}")
-            messagebox.showerror("오류", f"처리 중 오류가 발생했습니다:\n{str(e)}")
+            self.show_message('error', "오류", f"처리 중 오류가 발생했습니다:\n{str(e)}")
             
         finally:
             self.processing = False
-            self.url_start_button.state(['!disabled'])
+            self.finish_processing('url')
 
-    def process_excel_thread(self, input_file, output_file):
-        """엑셀 파일 처리 (별도 스레드)"""
-        try:
-            # 엑셀 파일 읽기
-            df = pd.read_excel(input_file)
-            total_rows = len(df)
-            results = []
-            
-            # 이벤트 루프 생성
-            loop = asyncio.new_event_loop()
-            asyncio.set_event_loop(loop)
-            
-            for index, row in df.iterrows():
-                # 처리 중단 확인
-                if not self.processing:
-                    self.log_message("처리가 중단되었습니다.")
-                    return
-                    
-                url = row['URL']
-                video_id = extract_video_id(url)
-                progress = (index + 1) / total_rows * 100
-                
-                self.progress_var.set(progress)
-                self.update_status(f"처리 중... ({index + 1}/{total_rows})")
-                
-                if video_id:
-                    self.log_message(f"Processing video {index + 1}: {url}")
-                    title = loop.run_until_complete(get_video_title_async(video_id))
-                    original_text, summary = loop.run_until_complete(get_video_summary_async(video_id))
-                    results.append({
-                        '제목': title,
-                        'URL': url,
-                        '원본 자막': original_text,
-                        'GPT 요약': summary
-                    })
+    def process_videos(self, urls, video_ids, writer, use_cache):
+        """
+        여러 URL을 동시에 처리하고, 결과를 writer(ExcelResultWriter)에 바로 기록합니다.
+        (ThreadPoolExecutor로 최대 MAX_CONCURRENT_VIDEOS개까지 동시 진행)
+        video_ids는 urls와 같은 순서의 비디오 ID 목록입니다. (찾지 못한 경우 NaN)
+
+        제목은 처음에 50개씩 묶어서 한꺼번에 조회하고, 자막 요약은 작업 스레드에서
+        동영상별로 진행합니다. 완료 순서는 입력 순서와 다를 수 있으므로, 앞 행이 끝날 때까지
+        잠시 보관했다가 입력 순서대로 기록합니다. 처리가 중단되면 False를 반환합니다.
+        """
+        total_rows = len(urls)
+        completed = 0
+        # 순서를 기다리며 보관 중인 결과 (행 번호 -> 행 값)와 다음에 기록할 행 번호
+        pending_rows = {}
+        next_index = 0
+        # 자막 길이 통계 (자막이 있는 동영상 수, 전체/최대 글자 수) - 처리하면서 바로 누적
+        transcript_count = 0
+        transcript_total_chars = 0
+        transcript_max_chars = 0
+
+        def write_ready_rows():
+            """앞에서부터 연속으로 완료된 행을 엑셀에 기록"""
+            nonlocal next_index
+            while next_index in pending_rows:
+                writer.write_row(pending_rows.pop(next_index))
+                next_index += 1
+
+        def process_one(index, url, video_id):
+            """작업 스레드에서 동영상 하나를 요약 (중단된 경우 None 반환)"""
+            # 처리 중단 확인 (대기 중이던 동영상은 시작하지 않음)
+            if not self.processing:
+                return None
+
+            self.log_message(f"Processing video {index + 1}: {url}")
+            original_text, summary = get_video_summary(video_id, use_cache)
+            return [titles[video_id], url, original_text, summary]
+
+        # 모든 비디오의 제목을 먼저 50개씩 묶어서 한꺼번에 조회
+        valid_ids = [video_id for video_id in video_ids if isinstance(video_id, str)]
+        if valid_ids:
+            self.log_message(f"비디오 제목 {len(valid_ids)}개를 조회하는 중...")
+        titles = get_video_titles(valid_ids, use_cache)
+
+        with ThreadPoolExecutor(max_workers=MAX_CONCURRENT_VIDEOS) as executor:
+            futures = {}
+            for index, (url, video_id) in enumerate(zip(urls, video_ids)):
+                # 비디오 ID를 찾지 못한 행은 NaN으로 들어오므로 작업을 만들지 않고 바로 보관
+                if isinstance(video_id, str):
+                    futures[executor.submit(process_one, index, url, video_id)] = index
                 else:
                     self.log_message(f"잘못된 URL 형식: {url}")
-                    results.append({
-                        '제목': '유효하지 않은 URL',
-                        'URL': url,
-                        '원본 자막': '',
-                        'GPT 요약': '유효하지 않은 YouTube URL입니다.'
-                    })
-            
-            # 이벤트 루프 종료
-            loop.close()
-            
-            # 결과를 DataFrame으로 변환하고 저장
-            result_df = pd.DataFrame(results)
-            
-            # 엑셀 파일 저장 및 서식 적용
-            save_excel_with_formatting(result_df, output_file)
+                    pending_rows[index] = ['유효하지 않은 URL', url, '', '유효하지 않은 YouTube URL입니다.']
+                    completed += 1
+
+            # 결과 기록과 통계 누적은 이 스레드에서만 하므로 별도의 잠금이 필요 없음
+            for future in as_completed(futures):
+                row = future.result()
+                if row is None:
+                    continue
+
+                original_text = row[2]
+                if original_text:
+                    transcript_count += 1
+                    transcript_total_chars += len(original_text)
+                    transcript_max_chars = max(transcript_max_chars, len(original_text))
+
+                pending_rows[futures[future]] = row
+                write_ready_rows()
+
+                # 완료된 개수 기준으로 진행률 표시 (완료 순서는 입력 순서와 다를 수 있음)
+                completed += 1
+                self.update_progress(completed / total_rows * 100)
+                self.update_status(f"처리 중... ({completed}/{total_rows})")
+
+        # 유효하지 않은 URL만 남은 경우 등 아직 기록하지 못한 앞쪽 행 정리
+        write_ready_rows()
+
+        # 중단으로 처리하지 못한 행이 중간에 있으면 그 뒤에 완료된 행은 순서를 기다리며 남아 있으므로,
+        # 빠진 행은 건너뛰고 남은 행을 입력 순서대로 모두 기록 (완료된 결과를 버리지 않도록 함)
+        if pending_rows:
+            self.log_message(f"중단되어 처리하지 못한 행을 건너뛰고 완료된 {len(pending_rows)}개 행을 마저 기록합니다.")
+            for index in sorted(pending_rows):
+                writer.write_row(pending_rows[index])
+            pending_rows.clear()
+
+        if transcript_count:
+            self.log_message(
+                f"자막 통계: {transcript_count}개 동영상, 총 {transcript_total_chars:,}자, "
+                f"최대 {transcript_max_chars:,}자, 평균 {transcript_total_chars / transcript_count:,.0f}자"
+            )
+
+        return self.processing
+
+    def process_excel_thread(self, input_file, output_file, use_cache, auto_open):
+        """엑셀 파일 처리 (별도 스레드, 화면 갱신은 모두 UI 큐를 통해 요청)"""
+        try:
+            # 엑셀 파일 읽기
+            df = read_input_urls(input_file)
+            # 모든 URL에서 비디오 ID를 한 번에 추출 (행마다 함수를 호출하지 않고 pandas 문자열 연산으로 처리)
+            df['video_id'] = df['URL'].str.extract(_VIDEO_ID_RE.pattern, expand=False)
+
+            # 결과 엑셀 파일을 먼저 만들고, 처리가 끝난 행부터 바로 기록
+            writer = ExcelResultWriter(output_file, RESULT_COLUMNS, self.log_message)
+            try:
+                # 모든 동영상을 작업 스레드 풀에서 동시에 처리
+                finished = self.process_videos(df['URL'].tolist(), df['video_id'].tolist(), writer, use_cache)
+            finally:
+                # 중단이나 오류가 발생해도 지금까지 기록한 행은 파일로 저장
+                writer.close()
+
+            # 처리 중단 확인
+            if not finished:
+                self.log_message(f"처리가 중단되었습니다. 완료된 {writer.rows_written}개 결과를 {output_file}에 저장했습니다.")
+                return
             
             # 처리 시간 계산
             end_time = datetime.now()
@@ -687,21 +1102,20 @@ class YouTubeSummarizerGUI:
             
             self.update_status("처리가 완료되었습니다!")
             self.log_message(f"총 처리 시간: {processing_time}")
-            messagebox.showinfo("완료", f"요약이 완료되었습니다.\n결과가 {output_file}에 저장되었습니다.\n총 처리 시간: {processing_time}")
+            self.show_message('info', "완료", f"요약이 완료되었습니다.\n결과가 {output_file}에 저장되었습니다.\n총 처리 시간: {processing_time}")
             
             # 자동 열기가 체크되어 있으면 파일 열기
-            if self.auto_open_var.get():
-                self.root.after(1000, lambda: open_file(output_file))
+            if auto_open:
+                self.schedule_open_file(output_file)
             
         except Exception as e:
             self.update_status(f"오류가 발생했습니다: {str(e)}")
             self.log_message(f"심각한 오류 발생: {str(e)}")
-            messagebox.showerror("오류", f"처리 중 오류가 발생했습니다:\n{str(e)}")
+            self.show_message('error', "오류", f"처리 중 오류가 발생했습니다:\n{str(e)}")
             
         finally:
             self.processing = False
-            self.excel_start_button.state(['!disabled'])
-            self.excel_stop_button.state(['disabled'])
+            self.finish_processing('excel')
 
 def main():
     """메인 함수"""